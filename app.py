@@ -2,13 +2,15 @@
 # Email/Phone Hunter – domain-restricted OSINT crawler (Windows + Linux)
 # Features: domain-filtered emails, optional phones, HTML+PDF parsing, robots toggle, external follow, UA rotation, CSV output.
 
-import argparse, csv, re, sys, time, datetime, collections, io, random
-from typing import Set, Dict, Tuple
-from urllib.parse import urljoin, urlparse
+import argparse, asyncio, csv, functools, hashlib, html, json, re, os, socket, sys, time, datetime, io, random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Set, Dict, Mapping, Tuple
+from urllib.parse import urlencode, urljoin, urlparse, urlunparse, parse_qsl
 import urllib.robotparser as robotparser
 
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+from aiohttp.abc import AbstractResolver
+from aiohttp.resolver import AsyncResolver, DefaultResolver
 
 # Optional PDF parsing
 try:
@@ -17,8 +19,22 @@ try:
 except Exception:
     PDF_OK = False
 
-EMAIL_RE = re.compile(r'(?i)\b[A-Z0-9._%+\-]+@([A-Z0-9.\-]+\.[A-Z]{2,})\b')
-PHONE_RE = re.compile(r'(?:(?:\+?\d{1,3}[\s\-\.]?)?(?:\(?\d{2,4}\)?[\s\-\.]?)?\d{3,4}[\s\-\.]?\d{3,4})')
+# Optional c-ares DNS (non-blocking lookups instead of getaddrinfo in a thread pool)
+try:
+    import aiodns  # noqa: F401
+    AIODNS_OK = True
+except Exception:
+    AIODNS_OK = False
+
+# Optional faster robots.txt matcher (Google-compatible wildcard/precedence rules)
+try:
+    from protego import Protego
+    PROTEGO_OK = True
+except Exception:
+    PROTEGO_OK = False
+
+# Digit-fenced, so a long run of digits fails at its edges instead of being re-split and retried at every offset.
+PHONE_RE = re.compile(r'(?<!\d)(?:\+\d{1,3}[\s.\-]?)?(?:(?:\(\d{2,4}\)|\d{2,4})[\s.\-]?)?\d{3,4}[\s.\-]?\d{3,4}(?!\d)')
 
 UA_POOL = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36",
@@ -27,6 +43,22 @@ UA_POOL = [
 ]
 
 SNIP_LEN = 160
+CSV_FIELDS = ("type","value","domain","source_url","source_type","page_title","snippet","first_seen")
+FETCH_TIMEOUT = 15
+RETRY_STATUS = {429, 500, 502, 503, 504}
+RETRIES = 3
+BACKOFF = 0.6
+ROBOTS_TTL = 6 * 3600
+MAX_BYTES = 10 * 1024 * 1024
+KEEPALIVE_TIMEOUT = 30
+_CHARSET_RE = re.compile(r'charset=["\']?([\w\-]+)', re.I)
+_DIGIT_RE = re.compile(r'\d')
+_NONDIGIT_RE = re.compile(r'\D')
+_ADDR_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-@")
+_HREF_RE = re.compile(r'''<a\s[^>]*?(?<![\w\-])href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))''', re.I)
+_TITLE_RE = re.compile(r'<title\b[^>]*>(.*?)</title\s*>', re.I | re.S)
+_NON_TEXT_RE = re.compile(r'<(script|style|template)\b.*?</\1\s*>|<!--.*?-->', re.I | re.S)
+_TAG_RE = re.compile(r'<[^>]*>')
 
 def now_iso() -> str:
     return datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
@@ -34,59 +66,245 @@ def now_iso() -> str:
 def normalize_email(e: str) -> str:
     return e.strip().strip('.,;:!?"\'()[]{}<>').lower()
 
+def canonicalize(url: str) -> str:
+    # Collapse variants that serve the same page: case of scheme/host, default port, fragment, trailing slash, query order.
+    p = urlparse(url)
+    scheme = p.scheme.lower()
+    host = p.netloc.lower()
+    default_port = {"http": ":80", "https": ":443"}.get(scheme)
+    if default_port and host.endswith(default_port):
+        host = host[:-len(default_port)]
+    query = urlencode(sorted(parse_qsl(p.query, keep_blank_values=True)))
+    return urlunparse((scheme, host, p.path.rstrip("/") or "/", p.params, query, ""))
+
+def url_key(url: str) -> int:
+    # 8-byte digest of the canonical URL: a fraction of the string's memory, collisions negligible at crawl sizes.
+    return int.from_bytes(hashlib.blake2b(canonicalize(url).encode("utf-8", "replace"), digest_size=8).digest(), "big")
+
 def domain_allowed(host: str, allowed_suffixes: Set[str]) -> bool:
+    # Look up each parent of the host (a.b.example.com, b.example.com, example.com, com) in the set:
+    # cost follows the number of labels, not the size of the allow-list.
     host = (host or "").lower()
-    return any(host == d or host.endswith("." + d) for d in allowed_suffixes)
-
-def email_matches_allowed(email: str, allowed_suffixes: Set[str]) -> bool:
-    if "@" not in email: return False
-    dom = email.split("@", 1)[1].lower()
-    return any(dom == d or dom.endswith("." + d) for d in allowed_suffixes)
+    while host:
+        if host in allowed_suffixes: return True
+        i = host.find(".")
+        if i == -1: return False
+        host = host[i + 1:]
+    return False
+
+@functools.lru_cache(maxsize=8)
+def allowed_email_re(allowed_suffixes: frozenset) -> "re.Pattern[str] | None":
+    # Email pattern with the allow-list folded into the domain part: addresses on other domains never become matches.
+    # The trailing lookahead rejects an allowed domain that is only the front of a longer one
+    # ("example.com.evil.org", "example.com-x.org", "example.com.au"); the \b rejects "example.company".
+    if not allowed_suffixes: return None
+    alts = "|".join(re.escape(d) for d in sorted(allowed_suffixes, key=len, reverse=True))
+    return re.compile(rf'\b[A-Z0-9._%+\-]+@(?:[A-Z0-9\-]+\.)*(?:{alts})\b(?![A-Z0-9.\-]*\.[A-Z]{{2,}}\b)', re.I)
+
+def _robots_parser(url: str, meta: dict) -> "Protego | robotparser.RobotFileParser":
+    if PROTEGO_OK:
+        if meta["status"] in (401, 403):
+            return Protego.parse("User-agent: *\nDisallow: /")
+        return Protego.parse("\n".join(meta["lines"]) if meta["status"] == 200 else "")
+    rp = robotparser.RobotFileParser(url)
+    if meta["status"] in (401, 403):
+        rp.disallow_all = True
+    elif meta["status"] == 200:
+        rp.parse(meta["lines"])
+    else:
+        rp.allow_all = True
+    return rp
 
-def load_robots(origin: str, ua: str, robots_cache: Dict[str, robotparser.RobotFileParser], verbose=False):
-    rp = robots_cache.get(origin)
-    if rp is None:
-        rp = robotparser.RobotFileParser()
+async def _read_robots(session: aiohttp.ClientSession, origin: str, prev: dict | None = None, verbose=False) -> "Tuple[Protego | robotparser.RobotFileParser, dict]":
+    # `prev` is the expired entry, if any: revalidate it with a conditional GET instead of refetching blind.
+    url = origin + "/robots.txt"
+    req_headers = {}
+    if prev and prev["etag"]: req_headers["If-None-Match"] = prev["etag"]
+    if prev and prev["last_modified"]: req_headers["If-Modified-Since"] = prev["last_modified"]
+    try:
+        status, _, headers, body = await fetch(session, url, req_headers)
+        if status == 304 and prev:
+            meta = dict(prev, fetched_at=time.time())
+            if verbose: print(f"[robots] not modified {url}")
+        else:
+            meta = {
+                "status": status,
+                "lines": body.decode("utf-8", "replace").splitlines() if status == 200 else [],
+                "etag": headers.get("ETag", ""),
+                "last_modified": headers.get("Last-Modified", ""),
+                "fetched_at": time.time(),
+            }
+            if verbose: print(f"[robots] loaded {url}")
+        return _robots_parser(url, meta), meta
+    except Exception:
+        # Keep serving the stale rules if we had any; an unreachable robots.txt is not a licence to crawl.
+        meta = dict(prev, fetched_at=time.time()) if prev else {"status": 0, "lines": [], "etag": "", "last_modified": "", "fetched_at": time.time()}
+        if verbose: print(f"[robots] failed {url} ({'keeping cached rules' if prev else 'default allow'})")
+        return _robots_parser(url, meta), meta
+
+def _robots_ready(fut: asyncio.Future) -> bool:
+    return fut.done() and not fut.cancelled() and fut.exception() is None
+
+async def load_robots(session: aiohttp.ClientSession, origin: str, robots_cache: Dict[str, "asyncio.Future[Tuple[Protego | robotparser.RobotFileParser, dict]]"], verbose=False):
+    # Cache the pending fetch itself so concurrent workers on one origin share a single request.
+    fut = robots_cache.get(origin)
+    if fut is None or (fut.done() and (not _robots_ready(fut) or time.time() - fut.result()[1]["fetched_at"] > ROBOTS_TTL)):
+        prev = fut.result()[1] if fut is not None and _robots_ready(fut) else None
+        fut = asyncio.ensure_future(_read_robots(session, origin, prev, verbose))
+        robots_cache[origin] = fut
+    return (await fut)[0]
+
+def load_robots_cache(path: str | None) -> Dict[str, "asyncio.Future[Tuple[Protego | robotparser.RobotFileParser, dict]]"]:
+    robots_cache = {}
+    if not path or not os.path.exists(path): return robots_cache
+    try:
+        with open(path, encoding="utf-8") as f:
+            saved = json.load(f)
+        if not isinstance(saved, dict): raise TypeError("expected a JSON object")
+    except Exception as e:
+        print(f"[WARN] Ignoring unreadable robots cache {path}: {e}", file=sys.stderr)
+        return robots_cache
+    loop = asyncio.get_running_loop()
+    for origin, entry in saved.items():
         try:
-            rp.set_url(origin + "/robots.txt"); rp.read()
-            if verbose: print(f"[robots] loaded {origin}/robots.txt")
-        except Exception:
-            if verbose: print(f"[robots] failed {origin}/robots.txt (default allow)")
-        robots_cache[origin] = rp
-    return rp
+            if not isinstance(entry["lines"], list): raise TypeError("lines is not a list")
+            meta = {
+                "status": int(entry["status"]),
+                "lines": [str(line) for line in entry["lines"]],
+                "etag": str(entry.get("etag") or ""),
+                "last_modified": str(entry.get("last_modified") or ""),
+                "fetched_at": float(entry["fetched_at"]),
+            }
+            rp = _robots_parser(origin + "/robots.txt", meta)
+        except Exception as e:
+            print(f"[WARN] Ignoring unreadable robots cache entry {origin} in {path}: {e!r}", file=sys.stderr)
+            continue
+        fut = loop.create_future()
+        fut.set_result((rp, meta))
+        robots_cache[origin] = fut
+    return robots_cache
+
+def save_robots_cache(path: str | None, robots_cache: Dict[str, "asyncio.Future[Tuple[Protego | robotparser.RobotFileParser, dict]]"]):
+    if not path: return
+    saved = {origin: fut.result()[1] for origin, fut in robots_cache.items() if _robots_ready(fut)}
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(saved, f)
+    except Exception as e:
+        print(f"[WARN] Could not write robots cache {path}: {e}", file=sys.stderr)
 
-def can_fetch(robots_cache, url, ua, honor_robots=True, verbose=False):
+async def can_fetch(session, robots_cache, url, ua, honor_robots=True, verbose=False):
     if not honor_robots:
         return True
     p = urlparse(url)
     if p.scheme not in ("http","https") or not p.netloc: return False
-    rp = load_robots(f"{p.scheme}://{p.netloc}", ua, robots_cache, verbose)
+    rp = await load_robots(session, f"{p.scheme}://{p.netloc}", robots_cache, verbose)
     try:
-        ok = rp.can_fetch(ua, url)
+        ok = rp.can_fetch(url, ua) if PROTEGO_OK else rp.can_fetch(ua, url)
         if verbose and not ok: print(f"[skip] robots disallow: {url}")
         return ok
     except Exception:
         return True
 
-def make_client(user_agent: str | None = None):
-    s = requests.Session()
-    s.headers.update({
-        "User-Agent": user_agent or random.choice(UA_POOL),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Connection": "close",
-    })
+class PinnedResolver(AbstractResolver):
+    # Resolves each (host, port, family) once per run; workers asking for a host that is still resolving share the lookup.
+    # prewarm() starts the seed lookups together up front instead of one by one as workers reach them.
+
+    def __init__(self):
+        self._inner = DefaultResolver()
+        # aiodns needs a SelectorEventLoop, but asyncio.run uses the Proactor loop on Windows.
+        if AIODNS_OK and sys.platform != "win32":
+            try:
+                self._inner = AsyncResolver()
+            except Exception:
+                pass
+        self._lookups: Dict[Tuple[str, int, int], asyncio.Future] = {}
+
+    def _lookup(self, host: str, port: int, family: int) -> asyncio.Future:
+        key = (host, port, family)
+        fut = self._lookups.get(key)
+        if fut is None:
+            fut = asyncio.ensure_future(self._inner.resolve(host, port, family=family))
+            fut.add_done_callback(lambda f: self._forget_failed(key, f))
+            self._lookups[key] = fut
+        return fut
+
+    def _forget_failed(self, key: Tuple[str, int, int], fut: asyncio.Future):
+        # Failed lookups are not pinned, so a later request retries them.
+        if fut.cancelled() or fut.exception() is not None:
+            self._lookups.pop(key, None)
+
+    def prewarm(self, urls, family: int = 0):
+        for u in urls:
+            p = urlparse(u)
+            if p.hostname:
+                self._lookup(p.hostname, p.port or (443 if p.scheme == "https" else 80), family)
+
+    async def resolve(self, host: str, port: int = 0, family: int = socket.AF_INET):
+        return await asyncio.shield(self._lookup(host, port, family))
+
+    async def close(self):
+        await self._inner.close()
+
+def make_client(user_agent: str | None = None, limit: int = 100, limit_per_host: int = 4,
+                resolver: AbstractResolver | None = None, verify_tls: bool = True) -> aiohttp.ClientSession:
+    # Connections stay open between requests so a same-host crawl pays the TCP/TLS handshake once per pooled socket.
+    # Certificate checks stay at aiohttp's default unless explicitly turned off (--insecure).
+    tls = {} if verify_tls else {"ssl": False}
+    connector = aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host,
+                                     keepalive_timeout=KEEPALIVE_TIMEOUT, resolver=resolver, **tls)
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=FETCH_TIMEOUT),
+        headers={
+            "User-Agent": user_agent or random.choice(UA_POOL),
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+        },
+    )
+
+async def fetch(session: aiohttp.ClientSession, url: str, headers: Mapping[str, str] | None = None,
+                max_bytes: int | None = None, accept: Callable[[str], bool] | None = None) -> tuple[int, str, Mapping[str, str], bytes]:
+    # Same retry policy the old requests/urllib3 adapter used: 3 tries, exponential backoff on 429/5xx.
+    # The body is streamed: an unwanted content type or anything over `max_bytes` comes back as b"" without being downloaded.
+    for attempt in range(RETRIES + 1):
+        try:
+            async with session.get(url, headers=headers, allow_redirects=True) as resp:
+                if resp.status in RETRY_STATUS and attempt < RETRIES:
+                    await asyncio.sleep(BACKOFF * (2 ** attempt))
+                    continue
+                if accept is not None and not accept(resp.headers.get("Content-Type", "")):
+                    return resp.status, str(resp.url), resp.headers, b""
+                if max_bytes is None:
+                    return resp.status, str(resp.url), resp.headers, await resp.read()
+                if (resp.content_length or 0) > max_bytes:
+                    return resp.status, str(resp.url), resp.headers, b""
+                chunks, size = [], 0
+                async for chunk in resp.content.iter_chunked(64 * 1024):
+                    size += len(chunk)
+                    if size > max_bytes:
+                        return resp.status, str(resp.url), resp.headers, b""
+                    chunks.append(chunk)
+                return resp.status, str(resp.url), resp.headers, b"".join(chunks)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt >= RETRIES: raise
+            await asyncio.sleep(BACKOFF * (2 ** attempt))
+    raise RuntimeError("unreachable")
+
+def decode_body(body: bytes, ct: str) -> str:
+    m = _CHARSET_RE.search(ct or "")
     try:
-        from urllib3.util.retry import Retry
-        from requests.adapters import HTTPAdapter
-        retries = Retry(total=3, connect=2, read=2, backoff_factor=0.6,
-                        status_forcelist=[429, 500, 502, 503, 504],
-                        allowed_methods=False)
-        s.mount("http://", HTTPAdapter(max_retries=retries))
-        s.mount("https://", HTTPAdapter(max_retries=retries))
-    except Exception:
-        pass
-    return s
+        return body.decode(m.group(1) if m else "utf-8", "replace")
+    except LookupError:
+        return body.decode("utf-8", "replace")
+
+async def polite_wait(host: str, last_fetch: Dict[str, float], host_locks: Dict[str, asyncio.Lock], rate: float):
+    # Space out request starts per host by `rate` seconds; different hosts never wait on each other.
+    lock = host_locks.setdefault(host, asyncio.Lock())
+    async with lock:
+        delay = last_fetch.get(host, 0.0) + rate - time.monotonic()
+        if delay > 0: await asyncio.sleep(delay)
+        last_fetch[host] = time.monotonic()
 
 def is_content_html(ct: str) -> bool:
     ct = (ct or "").lower()
@@ -96,50 +314,62 @@ def is_content_pdf(ct: str) -> bool:
     ct = (ct or "").lower()
     return "application/pdf" in ct or ct.endswith("/pdf")
 
-def title_of(soup: BeautifulSoup) -> str:
-    t = soup.find("title")
-    return (t.get_text(strip=True) if t else "")[:140]
+def title_of(html_text: str) -> str:
+    m = _TITLE_RE.search(html_text)
+    return html.unescape(_TAG_RE.sub("", m.group(1))).strip()[:140] if m else ""
+
+def text_of(html_text: str) -> str:
+    # Tags become spaces; script/style/template bodies and comments are dropped, as BeautifulSoup's get_text did.
+    return html.unescape(_TAG_RE.sub(" ", _NON_TEXT_RE.sub(" ", html_text)))
 
-def snippet_around(text: str, needle: str) -> str:
+def snippet_around(text: str, needle: str, text_lower: str | None = None) -> str:
     if not text: return ""
-    i = text.lower().find(needle.lower())
+    i = (text_lower if text_lower is not None else text.lower()).find(needle.lower())
     if i == -1: return ""
     start = max(0, i - SNIP_LEN//2); end = min(len(text), i + len(needle) + SNIP_LEN//2)
     return " ".join(text[start:end].split())
 
+def phone_ok(p: str) -> bool:
+    return len(_NONDIGIT_RE.sub("", p)) >= 8
+
 def extract_emails(text: str, allowed: Set[str]) -> Set[str]:
-    hits = set()
-    if not text: return hits
-    for m in EMAIL_RE.finditer(text):
-        email = normalize_email(m.group(0))
-        if email_matches_allowed(email, allowed):
-            hits.add(email)
-    return hits
+    if not text or "@" not in text: return set()
+    rx = allowed_email_re(frozenset(allowed))
+    return {normalize_email(m.group(0)) for m in rx.finditer(text)} if rx else set()
+
+def inside_email(text: str, start: int, end: int) -> bool:
+    # Widen the match over address characters; an "@" in that run means the digits belong to an email.
+    while start > 0 and text[start - 1] in _ADDR_CHARS: start -= 1
+    while end < len(text) and text[end] in _ADDR_CHARS: end += 1
+    return "@" in text[start:end]
 
 def extract_phones(text: str) -> Set[str]:
-    if not text: return set()
-    raw = set(x.strip() for x in PHONE_RE.findall(text))
-    cleaned = set()
-    for p in raw:
-        p2 = re.sub(r"[^\d+]", "", p)
-        digits = re.sub(r"\D", "", p2)
-        if len(digits) >= 8:
-            cleaned.add(p)
-    return cleaned
+    if not text or not _DIGIT_RE.search(text): return set()
+    check_email = "@" in text
+    return {p for p, m in ((m.group(0).strip(), m) for m in PHONE_RE.finditer(text))
+            if phone_ok(p) and not (check_email and inside_email(text, m.start(), m.end()))}
+
+def iter_hrefs(html_text: str):
+    for m in _HREF_RE.finditer(html_text):
+        href = m.group(1) if m.group(1) is not None else m.group(2) if m.group(2) is not None else m.group(3)
+        yield html.unescape(href).strip() if "&" in href else href.strip()
+
+def resolve_links(hrefs, base_url: str) -> list[str]:
+    return [nxt for nxt in (urljoin(base_url, href) for href in hrefs) if nxt.startswith(("http://", "https://"))]
+
+def page_links(body: bytes, ct: str, base_url: str) -> list[str]:
+    # Links only, for a body already scanned under another URL: relative hrefs still depend on this URL.
+    return resolve_links(iter_hrefs(decode_body(body, ct)), base_url) if is_content_html(ct) else []
 
 def handle_html(resp_text: str, base_url: str, depth: int, max_depth: int) -> tuple[str,str,list[str]]:
-    soup = BeautifulSoup(resp_text, "html.parser")
-    page_title = title_of(soup)
-    page_text = soup.get_text(separator=" ", strip=True)
-    for a in soup.select('a[href^="mailto:"]'):
-        href = a.get("href", "")
-        email = href.replace("mailto:", "").split("?", 1)[0]
-        page_text += " " + email
-    out_links = []
-    if depth < max_depth:
-        for a in soup.find_all("a", href=True):
-            nxt = urljoin(base_url, a["href"])
-            out_links.append(nxt)
+    # Title, text and links all come from regex passes over the raw markup; no DOM is built.
+    page_title = title_of(resp_text)
+    page_text = text_of(resp_text)
+    hrefs = list(iter_hrefs(resp_text))
+    mailtos = [href[7:].split("?", 1)[0] for href in hrefs if href[:7].lower() == "mailto:"]
+    out_links = resolve_links(hrefs, base_url) if depth < max_depth else []
+    if mailtos:
+        page_text += " " + " ".join(mailtos)
     return page_title, page_text, out_links
 
 def handle_pdf(content: bytes) -> str:
@@ -149,148 +379,203 @@ def handle_pdf(content: bytes) -> str:
     except Exception:
         return ""
 
-def main(argv=None):
+def parse_page(body: bytes, ct: str, base_url: str, depth: int, max_depth: int,
+               allowed: Set[str], include_phones: bool) -> tuple[str, list[str], Dict[str,str], Dict[str,str]]:
+    # Runs in a worker process: the DOM/PDF layout never leaves it, only title, links and hit snippets do.
+    if is_content_html(ct):
+        page_title, page_text, out_links = handle_html(decode_body(body, ct), base_url, depth, max_depth)
+    else:
+        page_title, page_text, out_links = "(PDF)", handle_pdf(body), []
+    email_hits = extract_emails(page_text, allowed)
+    phone_hits = extract_phones(page_text) if include_phones else set()
+    # Lower-case the page once for all hits rather than once per snippet lookup.
+    text_lower = page_text.lower() if email_hits or phone_hits else ""
+    emails = {e: snippet_around(page_text, e, text_lower) for e in email_hits}
+    phones = {ph: snippet_around(page_text, ph, text_lower) for ph in phone_hits}
+    return page_title, out_links, emails, phones
+
+def build_parser() -> argparse.ArgumentParser:
     ap = argparse.ArgumentParser(description="Email/Phone Hunter (domain-restricted)")
     ap.add_argument("--domains", nargs="+", required=True, help="Allowed base domains; only emails ending with these are recorded (subdomains allowed).")
     ap.add_argument("--start-urls", nargs="+", required=True, help="Seed URLs to fetch first.")
     ap.add_argument("--output", default="findings.csv", help="CSV output (default: findings.csv)")
     ap.add_argument("--max-pages", type=int, default=80, help="Max total pages to fetch")
     ap.add_argument("--depth", type=int, default=1, help="Link-follow depth")
-    ap.add_argument("--rate", type=float, default=1.0, help="Seconds between requests (be polite)")
+    ap.add_argument("--rate", type=float, default=1.0, help="Seconds between requests to the same host (be polite)")
+    ap.add_argument("--concurrency", type=int, default=100, help="Max requests in flight across all hosts (default 100)")
+    ap.add_argument("--per-host", type=int, default=4, help="Max open connections per host (default 4)")
+    ap.add_argument("--max-bytes", type=int, default=MAX_BYTES, help="Skip responses larger than this many bytes (default 10 MiB)")
     ap.add_argument("--include-pdfs", action="store_true", help="Parse PDFs (requires pdfminer.six)")
     ap.add_argument("--include-phones", action="store_true", help="Also extract phone numbers")
     ap.add_argument("--honor-robots", choices=["true","false"], default="true", help="Respect robots.txt (default true)")
+    ap.add_argument("--robots-cache", default=None, help="JSON file to persist robots.txt rules across runs (re-checked after 6h)")
     ap.add_argument("--external-follow", action="store_true", help="Allow following links to other sites (emails still filtered to allowed domains)")
+    ap.add_argument("--insecure", action="store_true", help="Skip TLS certificate verification (only for sites you trust, e.g. self-signed test hosts)")
     ap.add_argument("--user-agent", default=None, help="Custom UA string; rotates real browser UAs if omitted")
     ap.add_argument("--verbose", action="store_true", help="Verbose logging")
-    args = ap.parse_args(argv)
+    return ap
 
-    allowed: Set[str] = set(d.lower() for d in args.domains if d.strip())
+async def main_async(args) -> int:
+    allowed: Set[str] = frozenset(d.strip().lower() for d in args.domains if d.strip())
     honor = (args.honor_robots.lower() == "true")
 
     if args.include_pdfs and not PDF_OK:
         print("[WARN] --include-pdfs requested but pdfminer.six not installed. Run: pip install -U pdfminer.six", file=sys.stderr)
 
-    s = make_client(args.user_agent)
-    robots_cache: Dict[str, robotparser.RobotFileParser] = {}
-
-    queue: collections.deque[Tuple[str,int]] = collections.deque()
-    seen_urls: Set[str] = set()
-    results = []
-    emails_best: Dict[str, dict] = {}
+    queue: asyncio.Queue[Tuple[str,int]] = asyncio.Queue()
+    seen_urls: Set[int] = set()
+    seen_bodies: Dict[bytes, str] = {}
+    emitted_emails: Set[str] = set()
+    found = 0
+    robots_cache = load_robots_cache(args.robots_cache) if honor else {}
+    last_fetch: Dict[str, float] = {}
+    host_locks: Dict[str, asyncio.Lock] = {}
+    pages = 0
+    reserved = 0
+    budget = asyncio.Condition()
 
+    seeds = []
     for u in args.start_urls:
         try:
             pu = urlparse(u)
         except Exception:
             continue
         if pu.scheme in ("http","https"):
-            queue.append((u, 0))
-
-    pages = 0
-    while queue and pages < args.max_pages:
-        url0, depth = queue.popleft()
-        if url0 in seen_urls: continue
-        seen_urls.add(url0)
-
-        if honor and not can_fetch(robots_cache, url0, s.headers.get("User-Agent","Mozilla"), honor_robots=True, verbose=args.verbose):
-            continue
-
+            seeds.append(u)
+            queue.put_nowait((u, 0))
+
+    def wanted(ct: str) -> bool:
+        return is_content_html(ct) or (args.include_pdfs and is_content_pdf(ct))
+
+    def enqueue_links(out_links: list[str], depth: int):
+        # Filter and enqueue in one pass; the worker already dropped non-http(s) links.
+        for nxt in out_links:
+            if url_key(nxt) in seen_urls: continue
+            if args.external_follow or domain_allowed(urlparse(nxt).netloc, allowed):
+                queue.put_nowait((nxt, depth + 1))
+
+    async def process(session: aiohttp.ClientSession, url0: str, depth: int):
+        nonlocal reserved
+        key = url_key(url0)
+        if pages >= args.max_pages or key in seen_urls: return
+        seen_urls.add(key)
+
+        if honor and not await can_fetch(session, robots_cache, url0, session.headers.get("User-Agent","Mozilla"), honor_robots=True, verbose=args.verbose):
+            return
+
+        # Hold a slot of the --max-pages budget for the whole fetch+parse, so in-flight requests never exceed what is left.
+        # Pages that end up skipped hand their slot back, so a URL waits for a free slot rather than being dropped.
+        async with budget:
+            await budget.wait_for(lambda: pages >= args.max_pages or pages + reserved < args.max_pages)
+            if pages >= args.max_pages: return
+            reserved += 1
         try:
-            resp = s.get(url0, timeout=15, allow_redirects=True)
+            await crawl_page(session, url0, depth)
+        finally:
+            async with budget:
+                reserved -= 1
+                budget.notify_all()
+
+    async def crawl_page(session: aiohttp.ClientSession, url0: str, depth: int):
+        nonlocal pages, found
+        await polite_wait(urlparse(url0).netloc.lower(), last_fetch, host_locks, args.rate)
+        try:
+            status, final_url, headers, body = await fetch(session, url0, max_bytes=args.max_bytes, accept=wanted)
         except Exception as e:
             if args.verbose: print(f"[skip] fetch error {url0}: {e}")
-            continue
-
-        time.sleep(args.rate)
-
-        if resp.status_code != 200:
-            if args.verbose: print(f"[skip] HTTP {resp.status_code}: {url0}")
-            continue
-
-        final = urlparse(resp.url)
-        ct = resp.headers.get("Content-Type","").lower()
-        page_title, page_text = "", ""
-        out_links = []
-
-        if is_content_html(ct):
-            page_title, page_text, out_links = handle_html(resp.text, resp.url, depth, args.depth)
-        elif args.include_pdfs and is_content_pdf(ct):
-            page_title = "(PDF)"
-            page_text = handle_pdf(resp.content)
-        else:
-            if args.verbose: print(f"[skip] unsupported content-type {ct}: {resp.url}")
-            continue
+            return
+
+        if status != 200:
+            if args.verbose: print(f"[skip] HTTP {status}: {url0}")
+            return
+
+        ct = headers.get("Content-Type","").lower()
+        if not wanted(ct):
+            if args.verbose: print(f"[skip] unsupported content-type {ct}: {final_url}")
+            return
+        if not body:
+            if args.verbose: print(f"[skip] empty or over --max-bytes: {final_url}")
+            return
+        # Mirrors, tracking-param aliases and redirects to one page all yield the same bytes: scan them for hits once.
+        # The alias still gets its links followed, since relative hrefs resolve differently under another directory.
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if digest in seen_bodies:
+            if args.verbose: print(f"[dup] {final_url} has the same content as {seen_bodies[digest]}")
+            if depth < args.depth:
+                enqueue_links(await loop.run_in_executor(executor, page_links, body, ct, final_url), depth)
+            return
+        seen_bodies[digest] = final_url
+
+        page_title, out_links, emails, phones = await loop.run_in_executor(
+            executor, parse_page, body, ct, final_url, depth, args.depth, allowed, args.include_phones)
 
         pages += 1
-        if args.verbose: print(f"[ok ] {pages:4d} {resp.url}")
+        if args.verbose: print(f"[ok ] {pages:4d} {final_url}")
+        seen_at = now_iso()
 
-        filtered_links = []
         if depth < args.depth:
-            for nxt in out_links:
-                if nxt in seen_urls: continue
-                p = urlparse(nxt)
-                if p.scheme not in ("http","https"): continue
-                if args.external_follow or domain_allowed(p.netloc, allowed):
-                    filtered_links.append(nxt)
-        for nxt in filtered_links:
-            queue.append((nxt, depth + 1))
-
-        for email in extract_emails(page_text, allowed):
-            rec = {
-                "type": "email",
-                "value": email,
-                "domain": email.split("@",1)[1],
-                "source_url": resp.url,
-                "source_type": "pdf" if page_title == "(PDF)" else "html",
-                "page_title": page_title,
-                "snippet": snippet_around(page_text, email),
-                "first_seen": now_iso(),
-            }
-            if email not in emails_best:
-                emails_best[email] = rec
-
-        if args.include_phones:
-            for ph in extract_phones(page_text):
-                results.append({
-                    "type": "phone",
-                    "value": ph,
-                    "domain": "",
-                    "source_url": resp.url,
-                    "source_type": "pdf" if page_title == "(PDF)" else "html",
-                    "page_title": page_title,
-                    "snippet": snippet_around(page_text, ph),
-                    "first_seen": now_iso(),
-                })
-
-    for rec in emails_best.values():
-        results.append(rec)
-
-    if not results:
-        results.append({
-            "type": "info",
-            "value": "no_hits",
-            "domain": "",
-            "source_url": "",
-            "source_type": "",
-            "page_title": "",
-            "snippet": "No emails/phones matched. Try --external-follow, --include-pdfs, --include-phones, a real browser UA, smaller depth, different seeds.",
-            "first_seen": now_iso(),
-        })
+            enqueue_links(out_links, depth)
+
+        # Rows go straight to the CSV as plain tuples in CSV_FIELDS order; only email values are kept, to report each address once.
+        source_type = "pdf" if page_title == "(PDF)" else "html"
+        rows = []
+        for email, snippet in emails.items():
+            if email in emitted_emails: continue
+            emitted_emails.add(email)
+            rows.append(("email", email, email.split("@",1)[1], final_url, source_type, page_title, snippet, seen_at))
+        for ph, snippet in phones.items():
+            rows.append(("phone", ph, "", final_url, source_type, page_title, snippet, seen_at))
+        if rows:
+            w.writerows(rows)
+            out.flush()
+            found += len(rows)
+
+    async def worker(session: aiohttp.ClientSession):
+        while True:
+            url0, depth = await queue.get()
+            try:
+                await process(session, url0, depth)
+            except Exception as e:
+                if args.verbose: print(f"[skip] error {url0}: {e}")
+            finally:
+                queue.task_done()
 
     try:
-        with open(args.output, "w", newline="", encoding="utf-8") as f:
-            w = csv.DictWriter(f, fieldnames=[
-                "type","value","domain","source_url","source_type","page_title","snippet","first_seen"
-            ])
-            w.writeheader()
-            for rec in sorted(results, key=lambda r: ({"email":0,"phone":1,"info":2}.get(r["type"],9), r["value"])):
-                w.writerow(rec)
+        out = open(args.output, "w", newline="", encoding="utf-8")
     except Exception as e:
         print(f"[ERROR] Could not write CSV: {e}", file=sys.stderr); return 2
 
-    print(f"[OK] Found: {len(results)} items (emails+phones+info) | Pages fetched: {pages} | Output: {args.output}")
+    with out:
+        w = csv.writer(out)
+        w.writerow(CSV_FIELDS)
+
+        loop = asyncio.get_running_loop()
+        # Windows refuses process pools larger than 61 workers.
+        with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, 61)) as executor:
+            resolver = PinnedResolver()
+            resolver.prewarm(seeds)
+            async with make_client(args.user_agent, limit=args.concurrency, limit_per_host=args.per_host,
+                                   resolver=resolver, verify_tls=not args.insecure) as session:
+                workers = [asyncio.create_task(worker(session)) for _ in range(max(1, args.concurrency))]
+                await queue.join()
+                for t in workers: t.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+            await resolver.close()
+
+        if not found:
+            w.writerow(("info", "no_hits", "", "", "", "",
+                        "No emails/phones matched. Try --external-follow, --include-pdfs, --include-phones, a real browser UA, smaller depth, different seeds.",
+                        now_iso()))
+            found += 1
+
+    if honor: save_robots_cache(args.robots_cache, robots_cache)
+
+    print(f"[OK] Found: {found} items (emails+phones+info) | Pages fetched: {pages} | Output: {args.output}")
     return 0
 
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return asyncio.run(main_async(args))
+
 if __name__ == "__main__":
     raise SystemExit(main())
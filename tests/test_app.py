@@ -0,0 +1,54 @@
+import pytest
+
+import app
+
+ALLOWED = frozenset({"example.com"})
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("mail info@example.com now", {"info@example.com"}),
+    ("mail Bob@Mail.Example.COM.", {"bob@mail.example.com"}),
+    ("(h@example.com)", {"h@example.com"}),
+    ("x@example.com.evil.org", set()),
+    ("x@example.company", set()),
+    ("x@example.com-x.org", set()),
+    ("x@example.com.au", set()),
+    ("x@badexample.com", set()),
+])
+def test_extract_emails_allow_list(text, expected):
+    assert app.extract_emails(text, ALLOWED) == expected
+
+
+def test_allowed_email_re_empty_allow_list():
+    assert app.allowed_email_re(frozenset()) is None
+    assert app.extract_emails("a@example.com", set()) == set()
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("HTTPS://Example.COM:443/a/?b=2&a=1#frag", "https://example.com/a?a=1&b=2"),
+    ("https://example.com", "https://example.com/"),
+    ("http://example.com:80/x/", "http://example.com/x"),
+    ("http://example.com:8080/", "http://example.com:8080/"),
+    ("https://[::1]:8443/p", "https://[::1]:8443/p"),
+])
+def test_canonicalize(url, expected):
+    assert app.canonicalize(url) == expected
+
+
+def test_url_key_matches_variants():
+    assert app.url_key("https://example.com/a/?b=2&a=1#x") == app.url_key("https://EXAMPLE.com/a?a=1&b=2")
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("tel 6123 4567", {"6123 4567"}),
+    ("call 1234 5678", {"1234 5678"}),
+    ("+1 234 5678", {"+1 234 5678"}),
+    ("+65 6123 4567", {"+65 6123 4567"}),
+    ("Call +1 (555) 123-4567 today", {"+1 (555) 123-4567"}),
+    ("tel 020 7946 0958", {"020 7946 0958"}),
+    ("call 123 4567", set()),
+    ("id 123456789012345678901234", set()),
+    ("mail 12345678@example.com", set()),
+])
+def test_extract_phones(text, expected):
+    assert app.extract_phones(text) == expected